@@ -3,20 +3,33 @@
 import filecmp
 import fnmatch
 import os
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+import re
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from beets import config, util
 from beets.library import DefaultTemplateFunctions
 from beets.plugins import BeetsPlugin
 from beets.ui import get_path_formats
 from beets.util import MoveOperation
-from beets.util.functemplate import Template
+from beets.util.functemplate import Template, template
 from mediafile import TYPES as BEETS_FILE_TYPES
 
 from .filetote_dataclasses import (
     FiletoteArtifact,
     FiletoteArtifactCollection,
     FiletoteConfig,
+    FiletotePatternCategory,
 )
 from .mapping_model import FiletoteMappingFormatted, FiletoteMappingModel
 
@@ -25,6 +38,62 @@ if TYPE_CHECKING:
     from beets.library import Item, Library
 
 
+def _translate_glob(pattern: str, directory: bool = False) -> str:
+    """
+    Translates a glob pattern to a regex the way `fnmatch.fnmatch()` would. For
+    directory patterns, the regex instead matches paths where any ancestor matches,
+    since an ancestor is a prefix of the path that is followed by a separator.
+    """
+    translated: str = fnmatch.translate(os.path.normcase(pattern))
+
+    # Swap the end-of-string anchor (`\Z`, or `\z` in newer Pythons) for a separator
+    if directory and translated[-2:] in ("\\Z", "\\z"):
+        translated = translated[:-2] + re.escape(os.path.sep)
+
+    return translated
+
+
+def _is_glob_literal(text: str) -> bool:
+    """Checks if the text has no glob special characters, i.e., only matches
+    itself."""
+    return not any(char in text for char in "*?[")
+
+
+@lru_cache(maxsize=512)
+def _compile_pattern_category(patterns: Tuple[str, ...]) -> FiletotePatternCategory:
+    """
+    Compiles the patterns of a category once (and caches them). The order of the
+    patterns within a category doesn't change which category matches, so each
+    category can be checked with a suffix check and one regex rather than looping
+    over its patterns for every artifact.
+    """
+    suffixes: List[str] = []
+    translated_patterns: List[str] = []
+
+    for pattern in patterns:
+        # This ("/") may need to be changed for Win32
+        if pattern.endswith("/"):
+            translated_patterns.append(
+                _translate_glob(pattern.strip("/"), directory=True)
+            )
+            continue
+
+        file_pattern: str = pattern.lstrip("/")
+
+        # Patterns such as `*.jpg` only match by the end of the path
+        if file_pattern.startswith("*") and _is_glob_literal(file_pattern[1:]):
+            suffixes.append(os.path.normcase(file_pattern[1:]))
+        else:
+            translated_patterns.append(_translate_glob(file_pattern))
+
+    return FiletotePatternCategory(
+        suffixes=tuple(suffixes),
+        regex=(
+            re.compile("|".join(translated_patterns)) if translated_patterns else None
+        ),
+    )
+
+
 class FiletotePlugin(BeetsPlugin):
     """Plugin main class. Eventually, should encompass additional features as
     described in https://github.com/beetbox/beets/wiki/Attachments."""
@@ -64,6 +133,12 @@ class FiletotePlugin(BeetsPlugin):
         self._shared_artifacts: Dict[bytes, List[bytes]] = {}
         self._dirs_seen: List[bytes] = []
 
+        # The default template functions aren't bound to an Item or Library, so
+        # they're gathered once rather than for every artifact
+        self._template_functions: Dict[str, Callable[..., Any]] = (
+            DefaultTemplateFunctions().functions()
+        )
+
         self._register_file_operation_events()
 
     def _register_file_operation_events(self) -> None:
@@ -346,10 +421,9 @@ class FiletotePlugin(BeetsPlugin):
         assert selected_path_format is not None
         subpath_tmpl: Template = self._templatize_path_format(selected_path_format)
 
-        # Get template funcs and evaluate against mapping
-        template_functions = DefaultTemplateFunctions().functions()
+        # Evaluate against mapping with the template funcs
         artifact_path = (
-            subpath_tmpl.substitute(mapping_formatted, template_functions)
+            subpath_tmpl.substitute(mapping_formatted, self._template_functions)
             + artifact_ext
         )
 
@@ -365,13 +439,16 @@ class FiletotePlugin(BeetsPlugin):
         return util.bytestring_path(artifact_path_sanitized)
 
     def _templatize_path_format(self, path_format: Union[str, Template]) -> Template:
-        """Ensures that the path format is a Beets Template."""
+        """
+        Ensures that the path format is a Beets Template. Strings are compiled via
+        beets' memoized `template()`, so each distinct format is only parsed once.
+        """
         subpath_tmpl: Template
 
         if isinstance(path_format, Template):
             subpath_tmpl = path_format
         else:
-            subpath_tmpl = Template(path_format)
+            subpath_tmpl = template(path_format)
 
         return subpath_tmpl
 
@@ -484,17 +561,19 @@ class FiletotePlugin(BeetsPlugin):
                 )
                 break
 
-    def _is_beets_file_type(self, file_ext: Union[str, bytes]) -> bool:
-        """Checks if the provided file extension is a music file/track
-        (i.e., already handles by Beets)."""
-        return (
-            len(file_ext) > 1
-            and util.displayable_path(file_ext)[1:] in BEETS_FILE_TYPES
+    def _get_beets_file_extensions(self) -> FrozenSet[bytes]:
+        """Returns the lowercase file extensions (with leading period) of music
+        files/tracks (i.e., already handled by Beets), for matching while walking a
+        directory."""
+        return frozenset(
+            util.bytestring_path(f".{file_type.lower()}")
+            for file_type in BEETS_FILE_TYPES
         )
 
     def collect_artifacts(
         self, beets_item: "Item", source: bytes, destination: bytes
     ) -> None:
+        # pylint: disable=too-many-locals
         """
         Creates lists of the various extra files and artificats for processing.
         Since beets passes through the arguments, it's explicitly setting the Item to
@@ -514,6 +593,8 @@ class FiletotePlugin(BeetsPlugin):
             self._collect_paired_artifacts(beets_item, source, destination)
             return
 
+        beets_file_extensions: FrozenSet[bytes] = self._get_beets_file_extensions()
+
         non_handled_files: List[bytes] = []
         for root, _dirs, files in util.sorted_walk(
             source_path, ignore=config["ignore"].as_str_seq()
@@ -523,8 +604,9 @@ class FiletotePlugin(BeetsPlugin):
                 source_file = os.path.join(root, filename)
                 file_name, file_ext = os.path.splitext(filename)
 
-                # Skip any files extensions handled by beets
-                if self._is_beets_file_type(file_ext):
+                # Skip any files extensions handled by beets, which (like MediaFile)
+                # doesn't consider the case of the extension
+                if file_ext.lower() in beets_file_extensions:
                     continue
 
                 if not self.filetote.pairing.enabled:
@@ -601,26 +683,18 @@ class FiletotePlugin(BeetsPlugin):
                 (match_category, self.filetote.patterns[match_category])
             ]
 
+        # Only convert the path once per artifact
+        artifact_path: str = os.path.normcase(util.displayable_path(artifact_relpath))
+
         for category, patterns in pattern_definitions:
-            for pattern in patterns:
-                is_match: bool = False
-
-                # This ("/") may need to be changed for Win32
-                if pattern.endswith("/"):
-                    for path in util.ancestry(artifact_relpath):
-                        if not fnmatch.fnmatch(
-                            util.displayable_path(path), pattern.strip("/")
-                        ):
-                            continue
-                        is_match = True
-                else:
-                    is_match = fnmatch.fnmatch(
-                        util.displayable_path(artifact_relpath),
-                        pattern.lstrip("/"),
-                    )
+            compiled: FiletotePatternCategory = _compile_pattern_category(
+                tuple(patterns)
+            )
 
-                if is_match:
-                    return (is_match, category)
+            if artifact_path.endswith(compiled.suffixes) or (
+                compiled.regex is not None and compiled.regex.match(artifact_path)
+            ):
+                return (True, category)
 
         return (False, None)
 
@@ -662,7 +736,7 @@ class FiletotePlugin(BeetsPlugin):
 
         if (
             ".*" not in self.filetote.extensions
-            and util.displayable_path(artifact_file_ext) not in self.filetote.extensions
+            and artifact_file_ext not in self.filetote.extensions
             and util.displayable_path(artifact_filename) not in self.filetote.filenames
             and not is_pattern_match
             and not (
@@ -719,12 +793,27 @@ class FiletotePlugin(BeetsPlugin):
 
         return ""  # No subpath found
 
+    def _set_artifact_mapping_fields(
+        self,
+        mapping: FiletoteMappingModel,
+        source_path: bytes,
+        artifact_path: bytes,
+        artifact_filename: bytes,
+    ) -> None:
+        """Sets the artifact-specific `old_filename` and `subpath` mapping values."""
+        mapping.set(
+            "old_filename",
+            util.displayable_path(os.path.splitext(artifact_filename)[0]),
+        )
+        mapping.set("subpath", self._get_artifact_subpath(source_path, artifact_path))
+
     def process_artifacts(
         self,
         source_path: bytes,
         source_artifacts: List[FiletoteArtifact],
         mapping: FiletoteMappingModel,
     ) -> None:
+        # pylint: disable=too-many-locals
         """
         Processes and prepares extra files and artifacts for subsequent manipulation.
         """
@@ -733,6 +822,24 @@ class FiletotePlugin(BeetsPlugin):
 
         ignored_artifacts: List[bytes] = []
 
+        # The operation, reimport status, and pruning settings are the same for
+        # every artifact in the collection, so only determine them once.
+        operation: Optional[MoveOperation] = self.filetote.session.operation
+
+        # In copy and link modes, treat reimports specially: move in-library
+        # files. (Out-of-library files are copied/moved as usual).
+        reimport: bool = self._is_reimport()
+
+        prune_source: bool = operation == MoveOperation.MOVE or reimport
+
+        # Depending on the type of operation, the pruning root might be a specific
+        # import path, the base library, etc.
+        root_path: Optional[bytes] = None
+        clutter: List[str] = []
+        if prune_source:
+            root_path = self._get_prune_root_path()
+            clutter = config["clutter"].as_str_seq()
+
         for artifact in source_artifacts:
             artifact_source: bytes = artifact.path
 
@@ -755,13 +862,8 @@ class FiletotePlugin(BeetsPlugin):
                 ignored_artifacts.append(artifact_filename)
                 continue
 
-            mapping.set(
-                "old_filename",
-                util.displayable_path(os.path.splitext(artifact_filename)[0]),
-            )
-
-            mapping.set(
-                "subpath", self._get_artifact_subpath(source_path, artifact_path)
+            self._set_artifact_mapping_fields(
+                mapping, source_path, artifact_path, artifact_filename
             )
 
             artifact_dest: bytes = self._get_artifact_destination(
@@ -778,26 +880,13 @@ class FiletotePlugin(BeetsPlugin):
             artifact_dest = util.unique_path(artifact_dest)
             util.mkdirall(artifact_dest)
 
-            # In copy and link modes, treat reimports specially: move in-library
-            # files. (Out-of-library files are copied/moved as usual).
-            reimport: bool = self._is_reimport()
-
-            operation: Optional[MoveOperation] = self.filetote.session.operation
-
             self.manipulate_artifact(
                 operation, artifact_source, artifact_dest, reimport
             )
 
-            if operation == MoveOperation.MOVE or reimport:
-                # Prune vacated directory. Depending on the type of operation,
-                # this might be a specific import path, the base library, etc.
-                root_path: Optional[bytes] = self._get_prune_root_path()
-
-                util.prune_dirs(
-                    source_path,
-                    root=root_path,
-                    clutter=config["clutter"].as_str_seq(),
-                )
+            if prune_source:
+                # Prune vacated directory.
+                util.prune_dirs(source_path, root=root_path, clutter=clutter)
 
         self.print_ignored_artifacts(ignored_artifacts)
 
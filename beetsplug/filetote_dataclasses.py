@@ -2,7 +2,7 @@
 data used in processing extra files/artifacts."""
 
 from dataclasses import asdict, dataclass, field, fields
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 
 from beets.library import Library
 from beets.util import MoveOperation
@@ -31,6 +31,14 @@ class FiletoteArtifactCollection:
     item_dest: bytes
 
 
+@dataclass(frozen=True)
+class FiletotePatternCategory:
+    """The compiled patterns of a FileTote pattern category."""
+
+    suffixes: Tuple[str, ...]
+    regex: Optional[Pattern[str]]
+
+
 @dataclass
 class FiletoteSessionData:
     """Configuration settings for FileTote Item."""
@@ -232,4 +240,7 @@ def _raise_type_validation_error(
 
 
 def _format_config_hierarchy(parts: List[str]) -> str:
-    return "".join([f"[{part}]" for part in parts])
+    if not parts:
+        return ""
+
+    return f"[{']['.join(parts)}]"
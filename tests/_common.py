@@ -1,11 +1,14 @@
 """Setup for tests for the beets-filetote plugin."""
 
+import atexit
+import copy
 import os
 import shutil
 import sys
 import tempfile
 import unittest
-from typing import List, Optional
+import uuid
+from typing import Any, List, Optional
 
 import reflink
 from beets import config, logging, util
@@ -20,10 +23,82 @@ log.setLevel(logging.DEBUG)
 
 PLATFORM = sys.platform
 
+# Where test temp directories are created. Setting `FILETOTE_TEST_SHM=1` on Linux
+# opts into the RAM-backed `/dev/shm` (when writable) so the many small files
+# created and moved by the tests don't hit the disk. This is opt-in since tmpfs
+# doesn't support reflinks, which skips the reflink tests; by default, the system's
+# temp directory is used.
+SHM_DIR = "/dev/shm"
+TEMP_ROOT: Optional[str] = (
+    SHM_DIR
+    if os.environ.get("FILETOTE_TEST_SHM") == "1"
+    and PLATFORM.startswith("linux")
+    and os.access(SHM_DIR, os.W_OK)
+    else None
+)
+
 # OS feature test.
 HAVE_SYMLINK = PLATFORM != "win32"
 HAVE_HARDLINK = PLATFORM != "win32"
-HAVE_REFLINK = reflink.supported_at(tempfile.gettempdir())
+HAVE_REFLINK = reflink.supported_at(TEMP_ROOT or tempfile.gettempdir())
+
+# Sources of beets' default configuration, read (and parsed) once per test run.
+_DEFAULT_CONFIG_SOURCES: Optional[List[Any]] = None
+
+
+def reset_config() -> None:
+    """
+    Resets beets' global configuration to a "clean" source list including only
+    the defaults. The default YAML is only read on the first call; after that, a
+    copy of the parsed sources is restored.
+    """
+    global _DEFAULT_CONFIG_SOURCES  # pylint: disable=global-statement
+
+    if _DEFAULT_CONFIG_SOURCES is None:
+        config.sources = []
+        config.read(user=False, defaults=True)
+        _DEFAULT_CONFIG_SOURCES = copy.deepcopy(config.sources)
+    else:
+        config.sources = copy.deepcopy(_DEFAULT_CONFIG_SOURCES)
+
+
+# Directory that test temp directories are renamed into on teardown. It is created
+# lazily alongside the temp directories (so `os.rename` stays on one filesystem) and
+# removed in full once the test run exits.
+_TRASH_DIR: Optional[str] = None
+
+
+def _remove_trash_dir() -> None:
+    """Deletes the trash directory and any temp directories moved into it."""
+    if _TRASH_DIR is not None:
+        shutil.rmtree(_TRASH_DIR, ignore_errors=True)
+
+
+def discard_temp_dir(path: bytes) -> None:
+    """
+    Removes a temporary test directory. Where possible, the directory is renamed
+    into the trash directory (a single, constant-time syscall) and deleted at exit;
+    otherwise (e.g., on Windows) it is deleted immediately.
+    """
+    global _TRASH_DIR  # pylint: disable=global-statement
+
+    if PLATFORM != "win32":
+        if _TRASH_DIR is None:
+            _TRASH_DIR = tempfile.mkdtemp(prefix="filetote-trash-", dir=TEMP_ROOT)
+            atexit.register(_remove_trash_dir)
+
+        try:
+            os.rename(
+                path,
+                os.path.join(
+                    util.bytestring_path(_TRASH_DIR), uuid.uuid4().hex.encode()
+                ),
+            )
+            return
+        except OSError:
+            pass
+
+    shutil.rmtree(path)
 
 
 class AssertionsMixin:
@@ -66,12 +141,11 @@ class TestCase(unittest.TestCase):
 
     def setUp(self) -> None:
         # A "clean" source list including only the defaults.
-        config.sources = []
-        config.read(user=False, defaults=True)
+        reset_config()
 
         # Direct paths to a temporary directory. Tests can also use this
         # temporary directory.
-        self.temp_dir = util.bytestring_path(tempfile.mkdtemp())
+        self.temp_dir = util.bytestring_path(tempfile.mkdtemp(dir=TEMP_ROOT))
 
         config["statefile"] = util.py3_path(
             os.path.join(self.temp_dir, b"state.pickle")
@@ -89,7 +163,7 @@ class TestCase(unittest.TestCase):
 
     def tearDown(self) -> None:
         if os.path.isdir(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+            discard_temp_dir(self.temp_dir)
         if self._old_home is None:
             del os.environ["HOME"]
         else:
@@ -1,12 +1,26 @@
 """Helper functions for tests for the beets-filetote plugin."""
 
+import atexit
 import logging
 import os
 import shutil
+import tempfile
 from contextlib import contextmanager
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, astuple, dataclass
+from functools import partial
 from sys import version_info
-from typing import Any, Dict, Iterator, List, Optional
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from beets import config, library, plugins, util
 from beets.importer import ImportSession
@@ -35,6 +49,38 @@ beetsplug.__path__ = [os.path.abspath(os.path.join(__file__, "..", "..", "beetsp
 
 log = logging.getLogger("beets")
 
+# Flat import directories shared by all tests of the run, keyed by the arguments
+# they were created with, see `_create_shared_flat_import_dir()`. Each entry is
+# the directory, its number of media files, and the paths of its artifacts.
+_SHARED_IMPORT_DIRS: Dict[Hashable, Tuple[bytes, int, FrozenSet[str]]] = {}
+
+
+def _remove_shared_import_dirs() -> None:
+    """Deletes the shared import directories once the test run exits."""
+    for shared_import_dir, _, _ in _SHARED_IMPORT_DIRS.values():
+        shutil.rmtree(os.path.dirname(shared_import_dir), ignore_errors=True)
+
+
+atexit.register(_remove_shared_import_dirs)
+
+
+def _link_or_copy_file(
+    source: str, destination: str, artifact_paths: FrozenSet[str]
+) -> str:
+    """
+    Copy function for copying a shared import directory. The ``artifact_paths``
+    (which tests never modify in place) are hardlinked when possible. Everything
+    else, including the media files whose tags are written on import, is copied.
+    """
+    if source in artifact_paths:
+        try:
+            os.link(source, destination)
+            return destination
+        except OSError:
+            pass
+
+    return str(shutil.copy2(source, destination))
+
 
 class LogCapture(logging.Handler):
     """Provides the ability to capture logs within tests."""
@@ -96,6 +142,7 @@ class Assertions(_common.AssertionsMixin):
 
     def __init__(self) -> None:
         self.lib_dir: Optional[bytes] = None
+        self.album_lib_dir: Optional[bytes] = None
         self.import_dir: Optional[bytes] = None
 
     def assert_in_lib_dir(self, *segments: bytes) -> None:
@@ -106,6 +153,48 @@ class Assertions(_common.AssertionsMixin):
         if self.lib_dir:
             self.assert_exists(os.path.join(self.lib_dir, *segments))
 
+    def assert_files_in_lib_dir(
+        self, *segments: bytes, filenames: Iterable[bytes]
+    ) -> None:
+        """
+        Join the ``segments`` and assert that all ``filenames`` exist in that
+        directory of the library, listing the directory once rather than checking
+        each path
+        """
+        if self.lib_dir:
+            self._assert_files_in_dir(os.path.join(self.lib_dir, *segments), filenames)
+
+    def assert_album_dir_contains(self, *filenames: bytes) -> None:
+        """
+        Assert that all ``filenames`` exist in the default album directory of the
+        library, listing the directory once rather than checking each path
+        """
+        if self.album_lib_dir:
+            self._assert_files_in_dir(self.album_lib_dir, filenames)
+
+    def _assert_files_in_dir(
+        self,
+        directory: bytes,
+        filenames: Iterable[bytes],
+        directory_files: Optional[Set[bytes]] = None,
+    ) -> None:
+        """
+        Assert that all ``filenames`` exist in ``directory`` with one listing, or
+        in ``directory_files`` if the directory has already been listed.
+        """
+        if directory_files is None:
+            directory_files = self._list_dir(directory)
+
+        missing_files = [name for name in filenames if name not in directory_files]
+        self.assertions.assertFalse(
+            missing_files,
+            f"files do not exist in {directory!r}: {missing_files!r}",
+        )
+
+    def _list_dir(self, directory: bytes) -> Set[bytes]:
+        """Lists the filenames in ``directory``, if it exists."""
+        return set(os.listdir(directory)) if os.path.isdir(directory) else set()
+
     def assert_not_in_lib_dir(self, *segments: bytes) -> None:
         """
         Join the ``segments`` and assert that this path does not exist in
@@ -139,6 +228,31 @@ class Assertions(_common.AssertionsMixin):
         if self.import_dir:
             self.assert_does_not_exist(os.path.join(self.import_dir, *segments))
 
+    def assert_import_dir_contents(
+        self,
+        *segments: bytes,
+        present: Iterable[bytes] = (),
+        absent: Iterable[bytes] = (),
+    ) -> None:
+        """
+        Join the ``segments`` and assert that all ``present`` filenames exist and
+        none of the ``absent`` filenames exist in that directory of the import
+        directory
+        """
+        if not self.import_dir:
+            return
+
+        directory = os.path.join(self.import_dir, *segments)
+        directory_files = self._list_dir(directory)
+
+        self._assert_files_in_dir(directory, present, directory_files)
+
+        unexpected_files = [name for name in absent if name in directory_files]
+        self.assertions.assertFalse(
+            unexpected_files,
+            f"files exist in {directory!r}: {unexpected_files!r}",
+        )
+
     def assert_islink(self, *segments: bytes) -> None:
         """
         Join the ``segments`` with the `lib_dir` and assert that this path is a link
@@ -218,6 +332,9 @@ class FiletoteTestCase(_common.TestCase, Assertions, HelperUtils):
         self.load_plugins(other_plugins)
 
         self.lib_dir: bytes = os.path.join(self.temp_dir, b"testlib_dir")
+        self.album_lib_dir: bytes = os.path.join(
+            self.lib_dir, b"Tag Artist", b"Tag Album"
+        )
 
         self.lib: library.Library = self._create_library(self.lib_dir)
 
@@ -235,11 +352,15 @@ class FiletoteTestCase(_common.TestCase, Assertions, HelperUtils):
         self.in_out.install()
 
     def _create_library(self, lib_dir: bytes) -> library.Library:
-        lib_db = os.path.join(self.temp_dir, b"testlib.blb")
-
+        """
+        Creates the test library. The database itself is kept in memory since
+        no test needs it to persist, which avoids creating a database file for
+        every test. Imports aren't threaded in tests, so the single (per-thread)
+        connection sees all of the library's data.
+        """
         os.mkdir(lib_dir)
 
-        lib = library.Library(lib_db)
+        lib = library.Library(b":memory:")
         lib.directory = lib_dir
 
         lib.path_formats = [
@@ -255,6 +376,24 @@ class FiletoteTestCase(_common.TestCase, Assertions, HelperUtils):
         self.lib._close()
         super().tearDown()
 
+    def _reset_test_case(self) -> None:
+        """
+        Tears down and sets up the test case again, for tests which run multiple
+        scenarios (e.g., via `subTest`) that each need a fresh library and import.
+        """
+        self.tearDown()
+        self.setUp()
+
+    def _reset_config(self, other_plugins: Optional[List[str]] = None) -> None:
+        """
+        Resets beets' configuration to the defaults and reloads the plugin(s),
+        keeping the library and import directory. For tests which resolve
+        multiple scenarios (e.g., via `subTest`) without running an import.
+        """
+        self.unload_plugins()
+        _common.reset_config()
+        self.load_plugins(other_plugins or [])
+
     def load_plugins(self, other_plugins: List[str]) -> None:
         # pylint: disable=protected-access
         """Loads and sets up the plugin(s) for the test module."""
@@ -274,9 +413,11 @@ class FiletoteTestCase(_common.TestCase, Assertions, HelperUtils):
             else:
                 raise AssertionError(f"Attempt to load unknown plugin: {other_plugin}")
 
+        # The plugin modules are already imported above, so register the classes
+        # directly rather than having `plugins.load_plugins()` re-import and rescan
+        # each module for every test.
         plugins._classes = set(plugin_class_list)
         config["plugins"] = plugin_list
-        plugins.load_plugins(plugin_list)
 
     def unload_plugins(self) -> None:
         # pylint: disable=protected-access
@@ -300,6 +441,57 @@ class FiletoteTestCase(_common.TestCase, Assertions, HelperUtils):
                 # test.
                 del plugins._instances[plugin_class]
 
+    def _resolve_artifact_path(
+        self,
+        artifact_filename: bytes,
+        paired: bool = False,
+        media_meta: Optional[MediaMeta] = None,
+    ) -> bytes:
+        # pylint: disable=protected-access
+        """
+        Resolves the destination of an artifact using the currently configured
+        path formats, without running an import. The mapping is generated by the
+        plugin for a synthetic Item (described by ``media_meta``) that would be
+        imported from ``the_album`` (alongside the artifact) into the default album
+        directory. This exercises only Filetote's mapping, path query selection,
+        and templating, so it suits tests which only care about the resulting
+        filename.
+
+        Like ``_run_cli_command()``, each call creates a fresh plugin instance (so
+        it picks up the current config) and unloads it again afterwards.
+        """
+        plugin: filetote.FiletotePlugin = next(
+            instance
+            for instance in plugins.find_plugins()
+            if isinstance(instance, filetote.FiletotePlugin)
+        )
+
+        media_meta = media_meta or MediaMeta()
+
+        source_path: bytes = os.path.join(self.import_dir, b"the_album")
+
+        item = library.Item(
+            path=os.path.join(
+                source_path, f"track_{media_meta.track}.mp3".encode("utf-8")
+            ),
+            **asdict(media_meta),
+        )
+        item_destination: bytes = os.path.join(
+            self.album_lib_dir, f"{media_meta.title}.mp3".encode("utf-8")
+        )
+
+        try:
+            mapping = plugin._generate_mapping(item, item_destination)
+            plugin._set_artifact_mapping_fields(
+                mapping, source_path, source_path, artifact_filename
+            )
+
+            return plugin._get_artifact_destination(
+                artifact_filename, mapping, paired=paired
+            )
+        finally:
+            self.unload_plugins()
+
     def _run_cli_command(
         self, command: Literal["import", "modify", "move", "update"], **kwargs: Any
     ) -> None:
@@ -493,6 +685,70 @@ class FiletoteTestCase(_common.TestCase, Assertions, HelperUtils):
         log.debug("--- import directory created")
         self.list_files(self.import_dir)
 
+    def _create_shared_flat_import_dir(
+        self,
+        media_files: Optional[List[MediaSetup]] = None,
+        pair_subfolders: bool = False,
+    ) -> None:
+        """
+        Provides the same directory as ``_create_flat_import_dir()``, but only
+        creates (and tags) the media files and artifacts the first time it's called
+        with a given set of arguments during the test run. Subsequent calls receive
+        a fresh copy of that directory.
+        """
+        shared_key = (
+            tuple(astuple(media_file) for media_file in media_files or []),
+            pair_subfolders,
+        )
+
+        if shared_key in _SHARED_IMPORT_DIRS:
+            shared_import_dir, media_count, artifact_paths = _SHARED_IMPORT_DIRS[
+                shared_key
+            ]
+            self._copy_import_dir(shared_import_dir, artifact_paths)
+            self._media_count = self._pairs_count = media_count
+            return
+
+        self._create_flat_import_dir(
+            media_files=media_files,
+            pair_subfolders=pair_subfolders,
+        )
+
+        shared_import_dir = os.path.join(
+            util.bytestring_path(tempfile.mkdtemp(dir=_common.TEMP_ROOT)),
+            b"testsrc_dir",
+        )
+        shutil.copytree(
+            util.py3_path(self.import_dir), util.py3_path(shared_import_dir)
+        )
+
+        # Every file the directory was created with, other than the media files,
+        # is an artifact.
+        import_dir = util.py3_path(self.import_dir)
+        media_paths = {
+            os.path.relpath(util.py3_path(medium.filename), import_dir)
+            for medium in self.import_media or []
+        }
+
+        shared_dir = util.py3_path(shared_import_dir)
+        artifact_paths = frozenset(
+            os.path.join(root, filename)
+            for root, _dirs, files in os.walk(shared_dir)
+            for filename in files
+            if os.path.relpath(os.path.join(root, filename), shared_dir)
+            not in media_paths
+        )
+
+        # The media files belong to this test's copy, so leave `import_media` unset
+        # just as for the tests that receive a copy.
+        self.import_media = None
+
+        _SHARED_IMPORT_DIRS[shared_key] = (
+            shared_import_dir,
+            self._media_count,
+            artifact_paths,
+        )
+
     def _create_nested_import_dir(
         self,
         disc1_media_files: Optional[List[MediaSetup]] = None,
@@ -668,6 +924,25 @@ class FiletoteTestCase(_common.TestCase, Assertions, HelperUtils):
             setattr(medium, item, value)
         medium.save()
 
+    def _copy_import_dir(
+        self, source_dir: bytes, artifact_paths: FrozenSet[str] = frozenset()
+    ) -> None:
+        """
+        Sets the import_dir to a fresh copy of a previously created import
+        directory (e.g., one shared by all tests in the run) instead of
+        generating the media files and artifacts again. Only the files in
+        ``artifact_paths`` may be hardlinked rather than copied.
+        """
+        self._set_import_dir()
+        shutil.copytree(
+            util.py3_path(source_dir),
+            util.py3_path(self.import_dir),
+            copy_function=partial(_link_or_copy_file, artifact_paths=artifact_paths),
+        )
+
+        log.debug("--- import directory copied")
+        self.list_files(self.import_dir)
+
     def _set_import_dir(self) -> None:
         """
         Sets the import_dir and ensures that it is empty.
@@ -37,8 +37,7 @@ class FiletoteFromFlatDirectoryTest(FiletoteTestCase):
             self._media_count + 2, self.lib_dir, b"Tag Artist", b"Tag Album"
         )
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact2.file")
+        self.assert_album_dir_contains(b"artifact.file", b"artifact2.file")
 
         self.assert_in_import_dir(b"the_album", b"artifact.nfo")
         self.assert_in_import_dir(b"the_album", b"artifact.lrc")
@@ -59,8 +58,7 @@ class FiletoteFromFlatDirectoryTest(FiletoteTestCase):
             self._media_count + 2, self.lib_dir, b"Tag Artist", b"Tag Album"
         )
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact2.file")
+        self.assert_album_dir_contains(b"artifact.file", b"artifact2.file")
 
         self.assert_in_import_dir(b"the_album", b"artifact.file2")
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file2")
@@ -111,9 +109,9 @@ class FiletoteFromFlatDirectoryTest(FiletoteTestCase):
             self._media_count + 3, self.lib_dir, b"Tag Artist", b"Tag Album"
         )
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact2.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.nfo")
+        self.assert_album_dir_contains(
+            b"artifact.file", b"artifact2.file", b"artifact.nfo"
+        )
 
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
 
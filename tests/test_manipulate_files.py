@@ -41,10 +41,9 @@ class FiletoteManipulateFiles(FiletoteTestCase):
             self._base_file_count + 4, self.lib_dir, b"Tag Artist", b"Tag Album"
         )
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact2.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.nfo")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
+        self.assert_album_dir_contains(
+            b"artifact.file", b"artifact2.file", b"artifact.nfo", b"artifact.lrc"
+        )
 
     def test_move_artifacts(self) -> None:
         """Test that move actually moves (and not just copies)."""
@@ -57,10 +56,9 @@ class FiletoteManipulateFiles(FiletoteTestCase):
             self._base_file_count + 4, self.lib_dir, b"Tag Artist", b"Tag Album"
         )
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact2.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.nfo")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
+        self.assert_album_dir_contains(
+            b"artifact.file", b"artifact2.file", b"artifact.nfo", b"artifact.lrc"
+        )
 
         self.assert_not_in_import_dir(b"the_album", b"artifact.file")
         self.assert_not_in_import_dir(b"the_album", b"artifact2.file")
@@ -76,8 +74,9 @@ class FiletoteManipulateFiles(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1 - artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1 - artifact2.file")
+        self.assert_album_dir_contains(
+            b"track_1 - artifact.file", b"track_1 - artifact2.file"
+        )
 
     @pytest.mark.skipif(
         not _common.HAVE_SYMLINK, reason="need symlinks"
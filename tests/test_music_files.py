@@ -67,3 +67,18 @@ class FiletoteMusicFilesIgnoredTest(FiletoteTestCase):
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.alac.m4a")
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.wma")
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.wave")
+
+    def test_uppercase_music_file_types_are_ignored(self) -> None:
+        """Ensure that music file types are ignored by Filetote regardless of the
+        case of their extension, as beets imports them."""
+
+        self._create_flat_import_dir(
+            media_files=[MediaSetup(file_type="MP3", count=1, generate_pair=False)]
+        )
+        self._setup_import_session(autotag=False)
+
+        config["filetote"]["extensions"] = ".*"
+
+        self._run_cli_command("import")
+
+        self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.MP3")
@@ -45,10 +45,9 @@ class FiletoteFromNestedDirectoryTest(FiletoteTestCase):
             self._media_count + 4, self.lib_dir, b"Tag Artist", b"Tag Album"
         )
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact2.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact3.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact4.file")
+        self.assert_album_dir_contains(
+            b"artifact.file", b"artifact2.file", b"artifact3.file", b"artifact4.file"
+        )
 
         self.assert_in_import_dir(b"the_album", b"disc1", b"artifact_disc1.nfo")
         self.assert_in_import_dir(b"the_album", b"disc2", b"artifact_disc2.nfo")
@@ -75,10 +74,18 @@ class FiletoteFromNestedDirectoryTest(FiletoteTestCase):
             5, self.lib_dir, b"Tag Artist", b"Tag Album", b"02"
         )
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"01", b"artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"01", b"artifact2.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"02", b"artifact3.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"02", b"artifact4.file")
+        self.assert_files_in_lib_dir(
+            b"Tag Artist",
+            b"Tag Album",
+            b"01",
+            filenames=[b"artifact.file", b"artifact2.file"],
+        )
+        self.assert_files_in_lib_dir(
+            b"Tag Artist",
+            b"Tag Album",
+            b"02",
+            filenames=[b"artifact3.file", b"artifact4.file"],
+        )
 
         self.assert_in_import_dir(b"the_album", b"disc1", b"artifact_disc1.nfo")
         self.assert_in_import_dir(b"the_album", b"disc2", b"artifact_disc2.nfo")
@@ -117,15 +124,14 @@ class FiletoteFromNestedDirectoryTest(FiletoteTestCase):
             3, self.lib_dir, b"Tag Artist", b"Tag Album", b"02"
         )
 
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"artifacts", b"artifact.file"
-        )
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"artifacts", b"artifact2.file"
-        )
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"artifacts", b"artifact3.file"
-        )
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"artifacts", b"artifact4.file"
+        self.assert_files_in_lib_dir(
+            b"Tag Artist",
+            b"Tag Album",
+            b"artifacts",
+            filenames=[
+                b"artifact.file",
+                b"artifact2.file",
+                b"artifact3.file",
+                b"artifact4.file",
+            ],
         )
@@ -24,8 +24,7 @@ class FiletotePairingTest(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
+        self.assert_album_dir_contains(b"track_1.lrc", b"artifact.lrc")
 
     def test_pairingonly_requires_pairing_enabled(self) -> None:
         """Test that without `enabled`, `pairing_only` does nothing."""
@@ -40,8 +39,7 @@ class FiletotePairingTest(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
+        self.assert_album_dir_contains(b"track_1.lrc", b"artifact.lrc")
 
     def test_pairing_disabled_copies_all_matches(self) -> None:
         """Ensure that when pairing is disabled it does not do anything with pairs."""
@@ -53,8 +51,7 @@ class FiletotePairingTest(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
+        self.assert_album_dir_contains(b"track_1.lrc", b"artifact.lrc")
 
     def test_pairing_enabled_copies_all_matches(self) -> None:
         """ENsure that all pairs are copied."""
@@ -66,9 +63,7 @@ class FiletotePairingTest(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_2.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
+        self.assert_album_dir_contains(b"track_1.lrc", b"track_2.lrc", b"artifact.lrc")
 
     def test_pairing_enabled_works_without_pairs(self) -> None:
         """Ensure that even when there's not a pair, other files can be handled."""
@@ -98,8 +93,7 @@ class FiletotePairingTest(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
+        self.assert_album_dir_contains(b"track_1.lrc", b"artifact.lrc")
 
     def test_pairingonly_disabled_copies_all_matches(self) -> None:
         """Ensure that `pairing_only` disabled allows other matches to an
@@ -115,9 +109,7 @@ class FiletotePairingTest(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_2.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
+        self.assert_album_dir_contains(b"track_1.lrc", b"track_2.lrc", b"artifact.lrc")
 
     def test_pairingonly_enabled_copies_all_matches(self) -> None:
         """Test that `pairing_only` means that only pairs meeting a certain
@@ -133,8 +125,7 @@ class FiletotePairingTest(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_2.lrc")
+        self.assert_album_dir_contains(b"track_1.lrc", b"track_2.lrc")
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
 
     def test_pairingonly_does_not_require_pairs_for_all_media(self) -> None:
@@ -184,8 +175,7 @@ class FiletotePairingTest(FiletoteTestCase):
         self.assert_in_import_dir(b"the_album", b"track_1.lrc")
         self.assert_in_import_dir(b"the_album", b"artifact.lrc")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.kar")
+        self.assert_album_dir_contains(b"track_1.lrc", b"track_1.kar")
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.jpg")
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
 
@@ -214,7 +204,6 @@ class FiletotePairingTest(FiletoteTestCase):
         self.assert_in_import_dir(b"the_album", b"track_1.lrc")
         self.assert_in_import_dir(b"the_album", b"artifact.lrc")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.jpg")
+        self.assert_album_dir_contains(b"track_1.lrc", b"track_1.jpg")
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.kar")
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
@@ -82,8 +82,7 @@ class FiletoteReimportTest(FiletoteTestCase):
         self._run_cli_command("import")
 
         self.assert_number_of_files_in_dir(5, self.lib_dir, b"Tag Artist", b"Tag Album")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact2.file")
+        self.assert_album_dir_contains(b"artifact.file", b"artifact2.file")
 
     def test_do_nothing_when_paths_do_not_change_with_move_import(self) -> None:
         """Tests that when paths are the same (before/after), no action is
@@ -93,8 +92,7 @@ class FiletoteReimportTest(FiletoteTestCase):
         log.debug("--- second import")
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact2.file")
+        self.assert_album_dir_contains(b"artifact.file", b"artifact2.file")
 
     def test_rename_with_copy_reimport(self) -> None:
         """Tests that renaming during `copy` works even when reimporting."""
@@ -153,11 +151,10 @@ class FiletoteReimportTest(FiletoteTestCase):
 
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file")
         self.assert_not_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact2.file")
-        self.assert_in_lib_dir(
-            b"1Tag Artist", b"Tag Album", b"artifact - import I.file"
-        )
-        self.assert_in_lib_dir(
-            b"1Tag Artist", b"Tag Album", b"artifact2 - import I.file"
+        self.assert_files_in_lib_dir(
+            b"1Tag Artist",
+            b"Tag Album",
+            filenames=[b"artifact - import I.file", b"artifact2 - import I.file"],
         )
 
         log.debug("--- second import")
@@ -175,11 +172,10 @@ class FiletoteReimportTest(FiletoteTestCase):
         self.assert_not_in_lib_dir(
             b"1Tag Artist", b"Tag Album", b"artifact2 - import I.file"
         )
-        self.assert_in_lib_dir(
-            b"2Tag Artist", b"Tag Album", b"artifact - import I I.file"
-        )
-        self.assert_in_lib_dir(
-            b"2Tag Artist", b"Tag Album", b"artifact2 - import I I.file"
+        self.assert_files_in_lib_dir(
+            b"2Tag Artist",
+            b"Tag Album",
+            filenames=[b"artifact - import I I.file", b"artifact2 - import I I.file"],
         )
 
         log.debug("--- third import")
@@ -197,11 +193,13 @@ class FiletoteReimportTest(FiletoteTestCase):
         self.assert_not_in_lib_dir(
             b"2Tag Artist", b"Tag Album", b"artifact2 - import I I.file"
         )
-        self.assert_in_lib_dir(
-            b"3Tag Artist", b"Tag Album", b"artifact - import I I I.file"
-        )
-        self.assert_in_lib_dir(
-            b"3Tag Artist", b"Tag Album", b"artifact2 - import I I I.file"
+        self.assert_files_in_lib_dir(
+            b"3Tag Artist",
+            b"Tag Album",
+            filenames=[
+                b"artifact - import I I I.file",
+                b"artifact2 - import I I I.file",
+            ],
         )
 
     def test_reimport_artifacts_with_query(self) -> None:
@@ -1,13 +1,20 @@
 """Tests renaming for the beets-filetote plugin."""
 
-import logging
-from typing import List, Optional
+import os
+from typing import Dict, List, Optional, Tuple
 
 from beets import config
+from confuse import ConfigView
 
+from tests._item_model import MediaMeta
 from tests.helper import FiletoteTestCase
 
-log = logging.getLogger("beets")
+# Path formats shared by several tests, defined once at import.
+_ARTIST_ALBUM_FORMAT = "$albumpath/$artist - $album"
+_ARTIST_OLD_FILENAME_FORMAT = "$albumpath/$artist - $old_filename"
+_MEDIANAME_NEW_FORMAT = "$albumpath/$medianame_new"
+_PREFIXED_OLD_FILENAME_FORMAT = "$albumpath/1 $old_filename"
+_NEW_FILENAME_FORMAT = "$albumpath/new-filename"
 
 
 class FiletoteRenameTest(FiletoteTestCase):
@@ -20,226 +27,299 @@ class FiletoteRenameTest(FiletoteTestCase):
         """Provides shared setup for tests."""
         super().setUp()
 
-        self._create_flat_import_dir()
+        self._create_shared_flat_import_dir()
         self._setup_import_session(autotag=False)
 
+        # Bind the config views adjusted by `_configure()` once per test.
+        self._filetote_config: ConfigView = config["filetote"]
+        self._paths_config: ConfigView = config["paths"]
+        self._import_config: ConfigView = config["import"]
+
+    def _configure(
+        self,
+        extensions: Optional[str] = None,
+        filenames: Optional[str] = None,
+        paths: Optional[Dict[str, str]] = None,
+        pairing: bool = False,
+        move: bool = False,
+    ) -> None:
+        # pylint: disable=too-many-arguments
+        """Applies the Filetote, path, and import settings used by a test."""
+        if extensions is not None:
+            self._filetote_config["extensions"] = extensions
+
+        if filenames is not None:
+            self._filetote_config["filenames"] = filenames
+
+        if pairing:
+            self._filetote_config["pairing"]["enabled"] = True
+
+        for path_query, path_format in (paths or {}).items():
+            self._paths_config[path_query] = path_format
+
+        if move:
+            self._import_config["move"] = True
+
     def test_rename_when_copying(self) -> None:
         """Tests that renaming works when copying."""
-        config["filetote"]["extensions"] = ".file"
-        config["paths"]["ext:file"] = "$albumpath/$artist - $album"
+        self._configure(
+            extensions=".file",
+            paths={"ext:file": _ARTIST_ALBUM_FORMAT},
+        )
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - Tag Album.file"
+        self.assert_album_dir_contains(b"Tag Artist - Tag Album.file")
+        self.assert_import_dir_contents(
+            b"the_album", present=[b"artifact.file", b"artifact2.file"]
         )
-        self.assert_in_import_dir(b"the_album", b"artifact.file")
-        self.assert_in_import_dir(b"the_album", b"artifact2.file")
 
     def test_rename_when_moving(self) -> None:
         """Tests that renaming works when moving."""
-        config["filetote"]["extensions"] = ".file"
-        config["paths"]["ext:file"] = "$albumpath/$artist - $album"
-        config["import"]["move"] = True
+        self._configure(
+            extensions=".file",
+            paths={"ext:file": _ARTIST_ALBUM_FORMAT},
+            move=True,
+        )
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - Tag Album.file"
-        )
+        self.assert_album_dir_contains(b"Tag Artist - Tag Album.file")
         self.assert_not_in_import_dir(b"the_album", b"artifact.file")
 
     def test_rename_paired_ext(self) -> None:
         """Tests that the value of `medianame_new` populates in renaming."""
-        config["filetote"]["extensions"] = ".lrc"
-        config["filetote"]["pairing"]["enabled"] = True
-        config["paths"]["paired_ext:lrc"] = "$albumpath/$medianame_new"
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 2.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 3.lrc")
-
-    def test_rename_paired_ext_does_not_conflict_with_ext(self) -> None:
-        """Tests that paired path definitions work alongside `ext` ones."""
-        config["filetote"]["extensions"] = ".lrc"
-        config["filetote"]["pairing"]["enabled"] = True
-        config["paths"]["ext:lrc"] = "$albumpath/1 $old_filename"
-        config["paths"]["paired_ext:lrc"] = "$albumpath/$medianame_new"
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"1 artifact.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 2.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 3.lrc")
-
-    def test_rename_paired_ext_is_prioritized_over_ext(self) -> None:
-        """Tests that paired path definitions supersede `ext` ones when there's
-        a collision."""
-        config["filetote"]["extensions"] = ".lrc"
-        config["filetote"]["pairing"]["enabled"] = True
-        config["paths"]["paired_ext:lrc"] = "$albumpath/$medianame_new"
-        config["paths"]["ext:lrc"] = "$albumpath/1 $old_filename"
+        self._configure(
+            extensions=".lrc",
+            paths={"paired_ext:lrc": _MEDIANAME_NEW_FORMAT},
+            pairing=True,
+        )
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"1 artifact.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 2.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 3.lrc")
-
-    def test_rename_filename_is_prioritized_over_paired_ext(self) -> None:
-        """Tests that filename path definitions supersede `paired` ones when there's
-        a collision."""
-        config["filetote"]["extensions"] = ".lrc"
-        config["filetote"]["pairing"]["enabled"] = True
-        config["paths"]["paired_ext:lrc"] = "$albumpath/$medianame_new"
-        config["paths"]["filename:track_1.lrc"] = "$albumpath/1 $old_filename"
+        self.assert_album_dir_contains(
+            b"artifact.lrc", b"Tag Title 1.lrc", b"Tag Title 2.lrc", b"Tag Title 3.lrc"
+        )
 
-        self._run_cli_command("import")
+    def test_rename_paired_ext_priority(self) -> None:
+        """Tests that paired path definitions work alongside and supersede `ext`
+        ones (regardless of order) and that filename path definitions supersede
+        paired ones when there's a collision.
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"1 track_1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 2.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 3.lrc")
+        Since only the selected path definition differs, the destinations are
+        resolved directly rather than running an import for each case.
+        """
+        lrc_files: List[Tuple[bytes, bool, MediaMeta]] = [
+            (b"artifact.lrc", False, MediaMeta()),
+            (b"track_1.lrc", True, MediaMeta(title="Tag Title 1", track=1)),
+            (b"track_2.lrc", True, MediaMeta(title="Tag Title 2", track=2)),
+            (b"track_3.lrc", True, MediaMeta(title="Tag Title 3", track=3)),
+        ]
+
+        priority_cases: List[Tuple[str, Dict[str, str], List[bytes]]] = [
+            (
+                "paired_ext does not conflict with ext",
+                {
+                    "ext:lrc": _PREFIXED_OLD_FILENAME_FORMAT,
+                    "paired_ext:lrc": _MEDIANAME_NEW_FORMAT,
+                },
+                [
+                    b"1 artifact.lrc",
+                    b"Tag Title 1.lrc",
+                    b"Tag Title 2.lrc",
+                    b"Tag Title 3.lrc",
+                ],
+            ),
+            (
+                "paired_ext is prioritized over ext",
+                {
+                    "paired_ext:lrc": _MEDIANAME_NEW_FORMAT,
+                    "ext:lrc": _PREFIXED_OLD_FILENAME_FORMAT,
+                },
+                [
+                    b"1 artifact.lrc",
+                    b"Tag Title 1.lrc",
+                    b"Tag Title 2.lrc",
+                    b"Tag Title 3.lrc",
+                ],
+            ),
+            (
+                "filename is prioritized over paired_ext",
+                {
+                    "paired_ext:lrc": _MEDIANAME_NEW_FORMAT,
+                    "filename:track_1.lrc": _PREFIXED_OLD_FILENAME_FORMAT,
+                },
+                [
+                    b"artifact.lrc",
+                    b"1 track_1.lrc",
+                    b"Tag Title 2.lrc",
+                    b"Tag Title 3.lrc",
+                ],
+            ),
+        ]
+
+        for index, (case_name, paths, expected_files) in enumerate(priority_cases):
+            if index:
+                # Path definitions from previous cases can't be unset, so start
+                # each case from the default config.
+                self._reset_config()
+
+            with self.subTest(case_name):
+                self._configure(extensions=".lrc", paths=paths, pairing=True)
+
+                for (artifact_filename, paired, media_meta), expected_file in zip(
+                    lrc_files, expected_files
+                ):
+                    self.assert_equal_path(
+                        self._resolve_artifact_path(
+                            artifact_filename, paired=paired, media_meta=media_meta
+                        ),
+                        os.path.join(self.album_lib_dir, expected_file),
+                    )
 
     def test_rename_period_is_optional_for_ext(self) -> None:
         """
         Tests that leading periods are options when definiting `ext` paths.
         """
-        config["filetote"]["extensions"] = ".file .nfo"
-        config["paths"]["ext:file"] = "$albumpath/$artist - $album"
-        config["paths"]["ext:.nfo"] = "$albumpath/$artist - $album 2"
-        config["import"]["move"] = True
+        self._configure(
+            extensions=".file .nfo",
+            paths={
+                "ext:file": _ARTIST_ALBUM_FORMAT,
+                "ext:.nfo": "$albumpath/$artist - $album 2",
+            },
+            move=True,
+        )
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - Tag Album.file"
+        self.assert_album_dir_contains(
+            b"Tag Artist - Tag Album.file", b"Tag Artist - Tag Album 2.nfo"
         )
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - Tag Album 2.nfo"
+        self.assert_import_dir_contents(
+            b"the_album", absent=[b"artifact.file", b"artifact.nfo"]
         )
-        self.assert_not_in_import_dir(b"the_album", b"artifact.file")
-        self.assert_not_in_import_dir(b"the_album", b"artifact.nfo")
 
     def test_rename_ignores_file_when_name_conflicts(self) -> None:
         """Ensure that if there are multiple files that would rename to the
         exact same name, that only the first is renamed (moved/copied/etc.)
         but not subsequent ones that conflict."""
 
-        config["filetote"]["extensions"] = ".file"
-        config["paths"]["ext:file"] = "$albumpath/$artist - $album"
-        config["import"]["move"] = True
+        self._configure(
+            extensions=".file",
+            paths={"ext:file": _ARTIST_ALBUM_FORMAT},
+            move=True,
+        )
 
         self._run_cli_command("import")
 
         # `artifact.file` correctly renames.
-        self.assert_not_in_import_dir(b"the_album", b"artifact.file")
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - Tag Album.file"
-        )
+        self.assert_album_dir_contains(b"Tag Artist - Tag Album.file")
 
         # `artifact2.file` will not rename since the destination filename conflicts with
         # `artifact.file`
-        self.assert_in_import_dir(b"the_album", b"artifact2.file")
+        self.assert_import_dir_contents(
+            b"the_album", present=[b"artifact2.file"], absent=[b"artifact.file"]
+        )
 
     def test_rename_multiple_extensions(self) -> None:
         """Ensure that specifying multiple extensions and definitions properly
         rename."""
-        config["filetote"]["extensions"] = ".file .nfo"
-        config["paths"]["ext:file"] = "$albumpath/$artist - $album"
-        config["paths"]["ext:nfo"] = "$albumpath/$artist - $album"
-        config["import"]["move"] = True
+        self._configure(
+            extensions=".file .nfo",
+            paths={
+                "ext:file": _ARTIST_ALBUM_FORMAT,
+                "ext:nfo": _ARTIST_ALBUM_FORMAT,
+            },
+            move=True,
+        )
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - Tag Album.file"
+        self.assert_album_dir_contains(
+            b"Tag Artist - Tag Album.file", b"Tag Artist - Tag Album.nfo"
         )
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - Tag Album.nfo"
+        # `artifact2.file` will not rename since the destination filename conflicts
+        # with `artifact.file`
+        self.assert_import_dir_contents(
+            b"the_album",
+            present=[b"artifact2.file"],
+            absent=[b"artifact.file", b"artifact.nfo"],
         )
-        self.assert_not_in_import_dir(b"the_album", b"artifact.file")
-        self.assert_not_in_import_dir(b"the_album", b"artifact.nfo")
-        # `artifact2.file` will rename since the destination filename conflicts with
-        #  `artifact.file`
-        self.assert_in_import_dir(b"the_album", b"artifact2.file")
 
     def test_rename_matching_filename(self) -> None:
         """Ensure that `filename` path definitions rename correctly."""
-        config["filetote"]["filenames"] = "artifact.file artifact2.file"
-        config["paths"]["filename:artifact.file"] = "$albumpath/new-filename"
-        config["paths"]["filename:artifact2.file"] = "$albumpath/another-new-filename"
-        config["import"]["move"] = True
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"new-filename.file")
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"another-new-filename.file"
+        self._configure(
+            filenames="artifact.file artifact2.file",
+            paths={
+                "filename:artifact.file": _NEW_FILENAME_FORMAT,
+                "filename:artifact2.file": "$albumpath/another-new-filename",
+            },
+            move=True,
         )
-        self.assert_not_in_import_dir(b"the_album", b"artifact.file")
-        self.assert_not_in_import_dir(b"the_album", b"artifact2.file")
-
-    def test_rename_prioritizes_filename_over_ext(self) -> None:
-        """Tests that filename path definitions supersede `ext` ones when there's
-        a collision."""
-        config["filetote"]["extensions"] = ".file"
-        config["filetote"]["filenames"] = "artifact.file"
-        config["paths"]["ext:file"] = "$albumpath/$artist - $old_filename"
-        config["paths"]["filename:artifact.file"] = "$albumpath/new-filename"
-        config["import"]["move"] = True
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"new-filename.file")
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - artifact2.file"
+        self.assert_album_dir_contains(
+            b"new-filename.file", b"another-new-filename.file"
         )
-
-        self.assert_not_in_import_dir(b"the_album", b"artifact1.file")
-        self.assert_not_in_import_dir(b"the_album", b"artifact2.file")
-
-    def test_rename_prioritizes_filename_over_ext_reversed(self) -> None:
-        """Ensure the order of path definitions does not effect the priority
-        order.
-        """
-        config["filetote"]["extensions"] = ".file"
-        config["filetote"]["filenames"] = "artifact.file"
-        # order of paths matter here; this is the opposite order as
-        # `test_rename_prioritizes_filename_over_ext`
-        config["paths"]["filename:artifact.file"] = "$albumpath/new-filename"
-        config["paths"]["ext:file"] = "$albumpath/$artist - $old_filename"
-        config["import"]["move"] = True
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"new-filename.file")
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - artifact2.file"
+        self.assert_import_dir_contents(
+            b"the_album", absent=[b"artifact.file", b"artifact2.file"]
         )
 
-        self.assert_not_in_import_dir(b"the_album", b"artifact1.file")
-        self.assert_not_in_import_dir(b"the_album", b"artifact2.file")
+    def test_rename_prioritizes_filename_over_ext(self) -> None:
+        """Tests that filename path definitions supersede `ext` ones when there's
+        a collision, regardless of the order of the path definitions."""
+        path_orders: List[List[Tuple[str, str]]] = [
+            [
+                ("ext:file", _ARTIST_OLD_FILENAME_FORMAT),
+                ("filename:artifact.file", _NEW_FILENAME_FORMAT),
+            ],
+            [
+                ("filename:artifact.file", _NEW_FILENAME_FORMAT),
+                ("ext:file", _ARTIST_OLD_FILENAME_FORMAT),
+            ],
+        ]
+
+        for index, path_order in enumerate(path_orders):
+            if index:
+                self._reset_test_case()
+
+            with self.subTest(path_order=path_order):
+                self._configure(
+                    extensions=".file",
+                    filenames="artifact.file",
+                    paths=dict(path_order),
+                    move=True,
+                )
+
+                self._run_cli_command("import")
+
+                self.assert_album_dir_contains(
+                    b"new-filename.file", b"Tag Artist - artifact2.file"
+                )
+
+                self.assert_import_dir_contents(
+                    b"the_album", absent=[b"artifact.file", b"artifact2.file"]
+                )
 
     def test_rename_multiple_files_prioritizes_filename_over_ext(self) -> None:
         """Tests that multiple filename path definitions still supersede `ext`
         ones when there's collision(s)."""
-        config["filetote"]["extensions"] = ".file"
-        config["filetote"]["filenames"] = "artifact.file artifact2.file"
-        config["paths"]["ext:file"] = "$albumpath/$artist - $old_filename"
-        config["paths"]["filename:artifact.file"] = "$albumpath/new-filename"
-        config["paths"]["filename:artifact2.file"] = "$albumpath/new-filename2"
-        config["import"]["move"] = True
+        self._configure(
+            extensions=".file",
+            filenames="artifact.file artifact2.file",
+            paths={
+                "ext:file": _ARTIST_OLD_FILENAME_FORMAT,
+                "filename:artifact.file": _NEW_FILENAME_FORMAT,
+                "filename:artifact2.file": "$albumpath/new-filename2",
+            },
+            move=True,
+        )
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"new-filename.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"new-filename2.file")
+        self.assert_album_dir_contains(b"new-filename.file", b"new-filename2.file")
 
-        self.assert_not_in_import_dir(b"the_album", b"artifact1.file")
-        self.assert_not_in_import_dir(b"the_album", b"artifact2.file")
+        self.assert_import_dir_contents(
+            b"the_album", absent=[b"artifact.file", b"artifact2.file"]
+        )
@@ -19,41 +19,17 @@ class FiletoteRenameFiletoteFieldsTest(FiletoteTestCase):
     expected for custom path formats.
     """
 
+    _LYRICS_DIR: bytes = os.path.join(
+        b"Tag Artist", b"Tag Album", b"lyrics", b"lyric-subfolder"
+    )
+
     def setUp(self, other_plugins: Optional[List[str]] = None) -> None:
         """Provides shared setup for tests."""
         super().setUp()
 
-        self._create_flat_import_dir(pair_subfolders=True)
+        self._create_shared_flat_import_dir(pair_subfolders=True)
         self._setup_import_session(autotag=False, move=True)
 
-    def test_rename_field_albumpath(self) -> None:
-        """Tests that the value of `albumpath` populates in renaming."""
-        config["filetote"]["extensions"] = ".file"
-        config["paths"]["ext:file"] = "$albumpath/newname"
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"newname.file")
-
-    def test_rename_field_old_filename(self) -> None:
-        """Tests that the value of `old_filename` populates in renaming."""
-        config["filetote"]["extensions"] = ".file"
-        config["paths"]["ext:file"] = "$albumpath/$old_filename"
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact.file")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"artifact2.file")
-
-    def test_rename_field_medianame_old(self) -> None:
-        """Tests that the value of `medianame_old` populates in renaming."""
-        config["filetote"]["extensions"] = ".file"
-        config["paths"]["ext:file"] = "$albumpath/$medianame_old"
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"track_1.file")
-
     def test_rename_field_medianame_new(self) -> None:
         """Tests that the value of `medianame_new` populates in renaming."""
         config["filetote"]["extensions"] = ".lrc"
@@ -65,9 +41,9 @@ class FiletoteRenameFiletoteFieldsTest(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 1.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 2.lrc")
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"Tag Title 3.lrc")
+        self.assert_album_dir_contains(
+            b"Tag Title 1.lrc", b"Tag Title 2.lrc", b"Tag Title 3.lrc"
+        )
 
     def test_rename_field_subpath(self) -> None:
         """
@@ -83,24 +59,46 @@ class FiletoteRenameFiletoteFieldsTest(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(
-            b"Tag Artist",
-            b"Tag Album",
-            b"lyrics",
-            b"lyric-subfolder",
-            b"Tag Title 1.lrc",
+        self.assert_files_in_lib_dir(
+            self._LYRICS_DIR,
+            filenames=[b"Tag Title 1.lrc", b"Tag Title 2.lrc", b"Tag Title 3.lrc"],
         )
-        self.assert_in_lib_dir(
-            b"Tag Artist",
-            b"Tag Album",
-            b"lyrics",
-            b"lyric-subfolder",
-            b"Tag Title 2.lrc",
+
+
+class FiletoteResolveFiletoteFieldsTest(FiletoteTestCase):
+    """
+    Tests to check that Filetote resolves Filetote-provided fields as expected for
+    custom path formats. These only check the resolved destination for a synthetic
+    Item, so no media files or import directory are created.
+    """
+
+    def test_rename_field_albumpath(self) -> None:
+        """Tests that the value of `albumpath` populates in renaming."""
+        config["filetote"]["extensions"] = ".file"
+        config["paths"]["ext:file"] = "$albumpath/newname"
+
+        self.assert_equal_path(
+            self._resolve_artifact_path(b"artifact.file"),
+            os.path.join(self.album_lib_dir, b"newname.file"),
         )
-        self.assert_in_lib_dir(
-            b"Tag Artist",
-            b"Tag Album",
-            b"lyrics",
-            b"lyric-subfolder",
-            b"Tag Title 3.lrc",
+
+    def test_rename_field_old_filename(self) -> None:
+        """Tests that the value of `old_filename` populates in renaming."""
+        config["filetote"]["extensions"] = ".file"
+        config["paths"]["ext:file"] = "$albumpath/$old_filename"
+
+        for artifact_filename in [b"artifact.file", b"artifact2.file"]:
+            self.assert_equal_path(
+                self._resolve_artifact_path(artifact_filename),
+                os.path.join(self.album_lib_dir, artifact_filename),
+            )
+
+    def test_rename_field_medianame_old(self) -> None:
+        """Tests that the value of `medianame_old` populates in renaming."""
+        config["filetote"]["extensions"] = ".file"
+        config["paths"]["ext:file"] = "$albumpath/$medianame_old"
+
+        self.assert_equal_path(
+            self._resolve_artifact_path(b"artifact.file"),
+            os.path.join(self.album_lib_dir, b"track_1.file"),
         )
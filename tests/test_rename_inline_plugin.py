@@ -5,14 +5,22 @@ Tests that renaming using `item_fields` work as expected, when the
 
 import logging
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from beets import config
+from beets.util.functemplate import Template, template
 
 from tests.helper import FiletoteTestCase
 
 log = logging.getLogger("beets")
 
+# Compiled once at import; beets uses `Template` path formats as-is rather than
+# compiling them again.
+_INLINE_DEFAULT_PATH_FORMAT: Tuple[str, Template] = (
+    "default",
+    template(os.path.join("$artist", "$album", "%if{$multidisc,Disc $disc/}$title")),
+)
+
 
 class FiletoteInlineRenameTest(FiletoteTestCase):
     """
@@ -24,6 +32,8 @@ class FiletoteInlineRenameTest(FiletoteTestCase):
         """Provides shared setup for tests."""
         super().setUp(other_plugins=["inline"])
 
+        self.lib.path_formats[0] = _INLINE_DEFAULT_PATH_FORMAT
+
     def test_rename_works_with_inline_plugin(self) -> None:
         """Ensure that Filetote can rename fields as expected whth the `inline`
         plugin is enabled."""
@@ -41,11 +51,6 @@ class FiletoteInlineRenameTest(FiletoteTestCase):
 
         config["item_fields"]["multidisc"] = "1 if disctotal > 1 else 0"
 
-        self.lib.path_formats[0] = (
-            "default",
-            os.path.join("$artist", "$album", "%if{$multidisc,Disc $disc/}$title"),
-        )
-
         self._run_cli_command("import")
 
         self.assert_in_lib_dir(
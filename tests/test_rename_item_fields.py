@@ -1,7 +1,7 @@
 """Tests renaming Item fields for the beets-filetote plugin."""
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from beets import config
 
@@ -20,98 +20,56 @@ class FiletoteRenameItemFieldsTest(FiletoteTestCase):
         """Provides shared setup for tests."""
         super().setUp()
 
-        self._create_flat_import_dir()
+        self._create_shared_flat_import_dir()
         self._setup_import_session(autotag=False)
 
-    def test_rename_core_item_fields(self) -> None:
+    def test_rename_item_fields(self) -> None:
         """
-        Tests that the value of `title, `artist`, `albumartist`, and `album`
-        populate in renaming.
+        Tests that the default Item fields populate in renaming. Each group of
+        fields is rendered for a different artifact (via a `filename:` path
+        definition) so that all of them are checked with a single import:
+
+        - `title, `artist`, `albumartist`, and `album`
+        - `year, `month`, `day`, `$track, `tracktotal`, `disc`, and `disctotal`
+        - `lyric` and `comments`
+        - `bpm`, `length`, `format`, and `bitrate`. `length` will convert from
+          `M:SS` to `M_SS` for path-friendliness.
+        - `mb_albumid, `mb_artistid`, `mb_albumartistid`, `mb_trackid`,
+          `mb_releasetrackid`, and `mb_workid`
         """
-        config["filetote"]["extensions"] = ".file"
-        config["paths"][
-            "ext:file"
-        ] = "$albumpath/$artist - $album - $track $title ($albumartist) newname"
+        field_paths: Dict[str, Tuple[str, bytes]] = {
+            "artifact.file": (
+                "$albumpath/$artist - $album - $track $title ($albumartist) newname",
+                b"Tag Artist - Tag Album - 01 Tag Title 1 (Tag Album Artist)"
+                b" newname.file",
+            ),
+            "artifact2.file": (
+                "$albumpath/($year-$month-$day) - Track $track of $tracktotal - Disc"
+                " $disc of $disctotal",
+                b"(2023-02-03) - Track 01 of 05 - Disc 01 of 07.file",
+            ),
+            "artifact.nfo": (
+                "$albumpath/$lyrics ($comments)",
+                b"Tag lyrics (Tag comments).nfo",
+            ),
+            "artifact.lrc": (
+                "$albumpath/newname - ${bpm}bpm $length ($format) ($bitrate)",
+                b"newname - 8bpm 0_01 (MP3) (80kbps).lrc",
+            ),
+            "track_1.lrc": (
+                "$albumpath/$mb_artistid - $mb_albumid ($mb_albumartistid) -"
+                " $mb_trackid $mb_releasetrackid - $mb_workid",
+                b"someID-3 - someID-2 (someID-4) - someID-1 someID-5 - Tag work"
+                b" musicbrainz id.lrc",
+            ),
+        }
+
+        config["filetote"]["filenames"] = " ".join(field_paths)
+        for filename, (path_format, _) in field_paths.items():
+            config["paths"][f"filename:{filename}"] = path_format
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(
-            b"Tag Artist",
-            b"Tag Album",
-            b"Tag Artist - Tag Album - 01 Tag Title 1 (Tag Album Artist) newname.file",
-        )
-
-    def test_rename_other_meta_item_fields(self) -> None:
-        """
-        Tests that the value of `year, `month`, `day`, `$track, `tracktotal`
-        and `disc`, and `disctotal` populate in renaming.
-        """
-        config["filetote"]["extensions"] = ".file"
-        config["paths"]["ext:file"] = (
-            "$albumpath/($year-$month-$day) - Track $track of $tracktotal - Disc $disc"
-            " of $disctotal"
-        )
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(
-            b"Tag Artist",
-            b"Tag Album",
-            b"(2023-02-03) - Track 01 of 05 - Disc 01 of 07.file",
-        )
-
-    def test_rename_lyric_comment_item_fields(self) -> None:
-        """
-        Tests that the value of `lyric` and `comments` populate in renaming.
-        """
-        config["filetote"]["extensions"] = ".file"
-        config["paths"]["ext:file"] = "$albumpath/$lyrics ($comments)"
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(
-            b"Tag Artist",
-            b"Tag Album",
-            b"Tag lyrics (Tag comments).file",
-        )
-
-    def test_rename_track_music_item_fields(self) -> None:
-        """
-        Tests that the value of `bpm`, `length`, `format`, and `bitrate` populate
-        in renaming.
-
-        `length` will convert from `M:SS` to `M_SS` for path-friendliness.
-        """
-        config["filetote"]["extensions"] = ".file"
-        config["paths"][
-            "ext:file"
-        ] = "$albumpath/newname - ${bpm}bpm $length ($format) ($bitrate)"
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(
-            b"Tag Artist",
-            b"Tag Album",
-            b"newname - 8bpm 0_01 (MP3) (80kbps).file",
-        )
-
-    def test_rename_mb_item_fields(self) -> None:
-        """
-        Tests that the value of `mb_albumid, `mb_artistid`,
-        `mb_albumartistid`, `mb_trackid`, `mb_releasetrackid`,
-        and `mb_workid` populate in renaming.
-        """
-        config["filetote"]["extensions"] = ".file"
-        config["paths"]["ext:file"] = (
-            "$albumpath/$mb_artistid - $mb_albumid ($mb_albumartistid) - $mb_trackid"
-            " $mb_releasetrackid - $mb_workid"
-        )
-
-        self._run_cli_command("import")
-
-        self.assert_in_lib_dir(
-            b"Tag Artist",
-            b"Tag Album",
-            b"someID-3 - someID-2 (someID-4) - someID-1 someID-5 - Tag work"
-            b" musicbrainz id.file",
+        self.assert_album_dir_contains(
+            *[expected_filename for _, expected_filename in field_paths.values()]
         )
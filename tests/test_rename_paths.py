@@ -22,7 +22,7 @@ class FiletoteRenamePathsTest(FiletoteTestCase):
         """Provides shared setup for tests."""
         super().setUp()
 
-        self._create_flat_import_dir()
+        self._create_shared_flat_import_dir()
         self._setup_import_session(autotag=False)
 
     def test_rename_using_filetote_path_when_copying(self) -> None:
@@ -35,11 +35,8 @@ class FiletoteRenamePathsTest(FiletoteTestCase):
 
         self._run_cli_command("import")
 
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - Tag Album.file"
-        )
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"Tag Artist - Tag Album.nfo"
+        self.assert_album_dir_contains(
+            b"Tag Artist - Tag Album.file", b"Tag Artist - Tag Album.nfo"
         )
 
     def test_rename_using_filetote_path_pattern_optional(self) -> None:
@@ -62,10 +59,9 @@ class FiletoteRenamePathsTest(FiletoteTestCase):
             if line.startswith("filetote:"):
                 log.info(line)
 
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"file-pattern artifact.file"
+        self.assert_album_dir_contains(
+            b"file-pattern artifact.file", b"nfo-pattern artifact.nfo"
         )
-        self.assert_in_lib_dir(b"Tag Artist", b"Tag Album", b"nfo-pattern artifact.nfo")
 
     def test_rename_prioritizes_filetote_path(self) -> None:
         """Tests that renaming patterns works using setting from Filetote's paths
@@ -91,9 +87,6 @@ class FiletoteRenamePathsTest(FiletoteTestCase):
             if line.startswith("filetote:"):
                 log.info(line)
 
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"filetote_path artifact.file"
-        )
-        self.assert_in_lib_dir(
-            b"Tag Artist", b"Tag Album", b"filetote_path artifact.nfo"
+        self.assert_album_dir_contains(
+            b"filetote_path artifact.file", b"filetote_path artifact.nfo"
         )
@@ -2,33 +2,35 @@
 Tests that the version specified for the plugin matches the value in pyproject.
 """
 
-from typing import List, Optional
-
-import toml  # type: ignore # pylint: disable=import-error
+import sys
+import unittest
 
 import beetsplug
-from tests.helper import FiletoteTestCase
 
 
-class FiletoteVersionTest(FiletoteTestCase):
+class FiletoteVersionTest(unittest.TestCase):
     """
     Tests that the version specified for the plugin matches the value in
-    pyproject.
+    pyproject. This only reads `pyproject.toml`, so it doesn't need the
+    library and import setup of `FiletoteTestCase`.
     """
 
-    def setUp(self, other_plugins: Optional[List[str]] = None) -> None:
-        """Provides shared setup for tests."""
-        super().setUp()
-
     def test_version_matches(self) -> None:
         """Ensure that the Filetote version is properly reflected in the right
         areas."""
 
+        # pylint: disable=import-outside-toplevel,import-error
+        # Imported here so that collecting the suite doesn't load a TOML parser.
+        if sys.version_info >= (3, 11):
+            from tomllib import loads as toml_loads
+        else:
+            from toml import loads as toml_loads  # type: ignore
+
         plugin_version = beetsplug.__version__
 
         with open("./pyproject.toml", "r", encoding="utf-8") as pyproject_file:
-            data = toml.load(pyproject_file)
+            data = toml_loads(pyproject_file.read())
 
-            toml_version = data["tool"]["poetry"]["version"]
+        toml_version = data["tool"]["poetry"]["version"]
 
-            self.assertions.assertEqual(plugin_version, toml_version)
+        self.assertEqual(plugin_version, toml_version)
@@ -16,17 +16,22 @@ from beetsplug import (  # noqa: E402 # pylint: disable=wrong-import-position
 class TestTypeErrorFunctions(unittest.TestCase):
     """Test for functions in `filetote_dataclasses`, esp. TypeError validations."""
 
+    # Only checked via `isinstance`, so a single instance is shared by all tests.
+    pairing_dataclass: filetote_dataclasses.FiletotePairingData
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.pairing_dataclass = filetote_dataclasses.FiletotePairingData()
+
     def test__validate_types_instance(self) -> None:
         """Ensure the instance function correctly checks for the types."""
         # Ensure basic type check
         self._test_instance_validation(["test"], {}, dict, str)
 
         # Ensure Class type checks
-        pairing_dataclass = filetote_dataclasses.FiletotePairingData()
-
         self._test_instance_validation(
             ["test"],
-            pairing_dataclass,
+            self.pairing_dataclass,
             filetote_dataclasses.FiletotePairingData,
             filetote_dataclasses.FiletoteConfig,
         )
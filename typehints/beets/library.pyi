@@ -3,6 +3,7 @@ from typing import Any
 
 from .dbcore import Database
 from .dbcore.db import Model
+from .util.functemplate import Template
 
 class DefaultTemplateFunctions:
     def functions(self) -> dict[str, Callable[..., Any]]: ...
@@ -10,13 +11,13 @@ class DefaultTemplateFunctions:
 class Library(Database):
     path: bytes
     directory: bytes
-    path_formats: list[tuple[str, str]]
+    path_formats: list[tuple[str, str | Template]]
     replacements: list[str] | None
     def __init__(
         self,
         path: bytes,
         directory: str = "~/Music",
-        path_formats: list[tuple[str, str]] = [],
+        path_formats: list[tuple[str, str | Template]] = [],
         replacements: list[str] | None = None,
     ): ...
 
@@ -25,4 +26,4 @@ class LibModel(Model): ...
 class Item(LibModel):
     path: bytes
 
-    def __init__(self) -> None: ...
+    def __init__(self, db: Database | None = None, **values: Any) -> None: ...
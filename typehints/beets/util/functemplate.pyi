@@ -12,3 +12,5 @@ class Template:
         values: FormattedMapping,
         functions: dict[str, Callable[..., str]] = {},
     ) -> str: ...
+
+def template(fmt: str) -> Template: ...
@@ -3,6 +3,8 @@ from typing_extensions import TypeAlias
 Bytes_or_String: TypeAlias = str | bytes
 
 class MediaFile:
+    filename: Bytes_or_String
+
     def __init__(self, filething: Bytes_or_String, id3v23: bool = False): ...
     def save(self, **kwargs: dict[str, object]) -> None: ...
 